@@ -179,6 +179,9 @@ def log(
             console.print("[dim]No entries found[/dim]")
             return
 
+        # Resolve display settings once rather than per formatted entry
+        show_seconds = get_config_manager().show_seconds()
+
         # Create entries table
         table = Table()
         table.add_column("Task", style="bold")
@@ -193,7 +196,7 @@ def log(
                 duration = entry.end_time - entry.start_time
                 total_duration += duration.total_seconds()
                 end_str = format_datetime(entry.end_time)
-                duration_str = format_duration(duration)
+                duration_str = format_duration(duration, show_seconds=show_seconds)
             else:
                 end_str = "[yellow]Active[/yellow]"
                 duration_str = "[yellow]Running[/yellow]"
@@ -214,7 +217,8 @@ def log(
             from datetime import timedelta
 
             total = timedelta(seconds=total_duration)
-            console.print(f"\n[bold]Total: {format_duration(total)}[/bold]")
+            total_str = format_duration(total, show_seconds=show_seconds)
+            console.print(f"\n[bold]Total: {total_str}[/bold]")
 
     except Exception as e:
         console.print(f"[red]Error showing log: {e}[/red]")
@@ -6,13 +6,18 @@ This module provides the data access layer for time tracking sessions.
 
 import json
 import sqlite3
+from collections import Counter
 from datetime import date, datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import List, Optional, Set
 from uuid import UUID
 
 from .models import DailyStats, ProjectStats, TimeSession
 from .schema import DatabaseManager
 
+# Serialized forms of empty tags/metadata, which most sessions have
+EMPTY_TAGS_JSON = "[]"
+EMPTY_METADATA_JSON = "{}"
+
 
 class SessionRepository:
     """Repository for managing time tracking sessions in the database."""
@@ -34,11 +39,15 @@ class SessionRepository:
                     str(session.id),
                     session.task_name,
                     session.description,
-                    json.dumps(session.tags),
+                    self._tags_to_json(session.tags),
                     session.start_time.isoformat(),
                     session.end_time.isoformat() if session.end_time else None,
                     session.is_active,
-                    json.dumps(session.metadata),
+                    (
+                        json.dumps(session.metadata)
+                        if session.metadata
+                        else EMPTY_METADATA_JSON
+                    ),
                 ),
             )
             conn.commit()
@@ -78,11 +87,15 @@ class SessionRepository:
                 (
                     session.task_name,
                     session.description,
-                    json.dumps(session.tags),
+                    self._tags_to_json(session.tags),
                     session.start_time.isoformat(),
                     session.end_time.isoformat() if session.end_time else None,
                     session.is_active,
-                    json.dumps(session.metadata),
+                    (
+                        json.dumps(session.metadata)
+                        if session.metadata
+                        else EMPTY_METADATA_JSON
+                    ),
                     str(session.id),
                 ),
             )
@@ -186,18 +199,17 @@ class SessionRepository:
             )
             rows = cursor.fetchall()
 
-        return [
-            self._row_to_session(row)
-            for row in rows
-            if tag.lower() in json.loads(row["tags"])
-        ]
+        # Decode each row once and filter out LIKE false positives afterwards
+        tag = tag.lower()
+        sessions = [self._row_to_session(row) for row in rows]
+        return [session for session in sessions if tag in session.tags]
 
     def get_daily_stats(self, target_date: date) -> DailyStats:
         """Get statistics for a specific date."""
         sessions = self.get_sessions_for_date(target_date)
 
         total_duration = 0.0
-        all_tags = []
+        tag_counts: Counter[str] = Counter()
         session_durations = []
         unique_tasks = set()
 
@@ -206,25 +218,16 @@ class SessionRepository:
                 duration = session.duration or 0
                 total_duration += duration
                 session_durations.append(duration)
-                all_tags.extend(session.tags)
+                tag_counts.update(session.tags)
                 unique_tasks.add(session.task_name)
 
-        # Count tag frequency
-        tag_counts: Dict[str, int] = {}
-        for tag in all_tags:
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-        # Sort tags by frequency
-        most_used_tags = sorted(
-            tag_counts.keys(), key=lambda x: tag_counts[x], reverse=True
-        )[:5]
+        # Most frequent tags first
+        most_used_tags = [tag for tag, _ in tag_counts.most_common(5)]
 
         return DailyStats(
             date=target_date.isoformat(),
             total_duration=total_duration,
-            session_count=len(
-                [s for s in sessions if s.end_time]
-            ),  # Only completed sessions
+            session_count=len(session_durations),  # Only completed sessions
             unique_tasks=len(unique_tasks),
             most_used_tags=most_used_tags,
             longest_session=max(session_durations) if session_durations else None,
@@ -233,9 +236,26 @@ class SessionRepository:
     def get_project_stats(self, task_name: str) -> ProjectStats:
         """Get statistics for a specific project/task."""
         sessions = self.get_sessions_by_task(task_name)
-        completed_sessions = [s for s in sessions if s.end_time]
 
-        if not completed_sessions:
+        # Aggregate completed sessions in a single pass
+        total_duration = 0.0
+        session_count = 0
+        unique_tags: Set[str] = set()
+        first_session: Optional[datetime] = None
+        last_session: Optional[datetime] = None
+
+        for session in sessions:
+            if not session.end_time:
+                continue
+            total_duration += session.duration or 0
+            session_count += 1
+            unique_tags.update(session.tags)
+            if first_session is None or session.start_time < first_session:
+                first_session = session.start_time
+            if last_session is None or session.start_time > last_session:
+                last_session = session.start_time
+
+        if not session_count:
             return ProjectStats(
                 task_name=task_name,
                 total_duration=0.0,
@@ -246,35 +266,37 @@ class SessionRepository:
                 last_session=None,
             )
 
-        total_duration = sum(s.duration or 0 for s in completed_sessions)
-        all_tags = []
-        for session in completed_sessions:
-            all_tags.extend(session.tags)
-
-        # Get unique tags
-        unique_tags = list(set(all_tags))
-
         return ProjectStats(
             task_name=task_name,
             total_duration=total_duration,
-            session_count=len(completed_sessions),
-            average_session=total_duration / len(completed_sessions),
-            tags=unique_tags,
-            first_session=min(s.start_time for s in completed_sessions),
-            last_session=max(s.start_time for s in completed_sessions),
+            session_count=session_count,
+            average_session=total_duration / session_count,
+            tags=list(unique_tags),
+            first_session=first_session,
+            last_session=last_session,
         )
 
+    def _tags_to_json(self, tags: List[str]) -> str:
+        """Normalize tags and serialize them for storage."""
+        # Tags assigned after construction bypass the model validator
+        normalized = TimeSession.validate_tags(tags)
+        return json.dumps(normalized) if normalized else EMPTY_TAGS_JSON
+
     def _row_to_session(self, row: sqlite3.Row) -> TimeSession:
         """Convert a database row to a TimeSession model."""
         return TimeSession(
             id=UUID(row["id"]),
             task_name=row["task_name"],
             description=row["description"],
-            tags=json.loads(row["tags"]),
+            tags=json.loads(row["tags"]) if row["tags"] != EMPTY_TAGS_JSON else [],
             start_time=datetime.fromisoformat(row["start_time"]),
             end_time=(
                 datetime.fromisoformat(row["end_time"]) if row["end_time"] else None
             ),
             is_active=bool(row["is_active"]),
-            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            metadata=(
+                json.loads(row["metadata"])
+                if row["metadata"] and row["metadata"] != EMPTY_METADATA_JSON
+                else {}
+            ),
         )
@@ -1,4 +1,5 @@
 import os
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -52,6 +53,24 @@ async def test_notify_disabled_in_config() -> None:
             )
 
 
+@pytest.mark.asyncio
+async def test_notify_fallback_skipped_when_info_disabled() -> None:
+    """Test that the log fallback is not built when INFO logging is disabled."""
+    with patch("clockman.utils.notifier.get_config_manager") as mock_config:
+        mock_config_instance = MagicMock()
+        mock_config_instance.are_notifications_enabled.return_value = False
+        mock_config_instance.should_fallback_to_log.return_value = True
+        mock_config.return_value = mock_config_instance
+
+        with patch("clockman.utils.notifier.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+
+            result = await notifier.notify("Test Title", "Test Message")
+
+            assert result is None
+            mock_logger.info.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_notify_headless_environment() -> None:
     """Test notify behavior in headless environment (no DISPLAY)."""
@@ -104,9 +123,35 @@ async def test_notify_handles_exception() -> None:
             )
 
 
+@pytest.mark.asyncio
+async def test_notify_handles_missing_backend() -> None:
+    """Test that notify reports a missing desktop_notifier backend on first use."""
+    with (
+        patch("clockman.utils.notifier.get_config_manager") as mock_config,
+        patch("clockman.utils.notifier._notifier", None),
+        patch.dict(sys.modules, {"desktop_notifier": None}),
+        patch.dict(os.environ, {"DISPLAY": ":0"}, clear=True),
+    ):
+        mock_config_instance = MagicMock()
+        mock_config_instance.are_notifications_enabled.return_value = True
+        mock_config_instance.should_fallback_to_log.return_value = False
+        mock_config.return_value = mock_config_instance
+
+        result = await notifier.notify("Test Title", "Test Message")
+
+        assert result is not None
+        assert result.startswith("Desktop notifications not available")
+
+
 def test_notify_sync_success() -> None:
     """Test that notify_sync works correctly in normal conditions."""
-    with patch("clockman.utils.notifier.asyncio.run") as mock_run:
+    with (
+        patch("clockman.utils.notifier.get_config_manager") as mock_config,
+        patch("clockman.utils.notifier.asyncio.run") as mock_run,
+    ):
+        mock_config_instance = MagicMock()
+        mock_config_instance.are_notifications_enabled.return_value = True
+        mock_config.return_value = mock_config_instance
         mock_run.return_value = None
 
         result = notifier.notify_sync("Sync Title", "Sync Message")
@@ -115,6 +160,27 @@ def test_notify_sync_success() -> None:
         mock_run.assert_called_once()
 
 
+def test_notify_sync_skips_event_loop_when_disabled() -> None:
+    """Test that notify_sync returns early without an event loop when disabled."""
+    with (
+        patch("clockman.utils.notifier.get_config_manager") as mock_config,
+        patch("clockman.utils.notifier.asyncio.run") as mock_run,
+        patch("clockman.utils.notifier.logger") as mock_logger,
+    ):
+        mock_config_instance = MagicMock()
+        mock_config_instance.are_notifications_enabled.return_value = False
+        mock_config_instance.should_fallback_to_log.return_value = True
+        mock_config.return_value = mock_config_instance
+
+        result = notifier.notify_sync("Sync Title", "Sync Message")
+
+        assert result is None
+        mock_run.assert_not_called()
+        mock_logger.info.assert_called_once_with(
+            "[NOTIFICATION] Sync Title: Sync Message"
+        )
+
+
 def test_notify_sync_handles_runtime_error() -> None:
     """Test notify_sync fallback when RuntimeError occurs (nested event loop)."""
     with (
@@ -123,7 +189,11 @@ def test_notify_sync_handles_runtime_error() -> None:
             side_effect=RuntimeError("No running loop"),
         ),
         patch("clockman.utils.notifier.asyncio.run") as mock_run,
+        patch("clockman.utils.notifier.get_config_manager") as mock_config,
     ):
+        mock_config_instance = MagicMock()
+        mock_config_instance.are_notifications_enabled.return_value = True
+        mock_config.return_value = mock_config_instance
         mock_run.return_value = None
 
         result = notifier.notify_sync("Fallback Title", "Fallback Message")
@@ -138,7 +208,12 @@ def test_notify_sync_in_async_context() -> None:
         patch("clockman.utils.notifier.asyncio.get_running_loop") as mock_get_loop,
         patch("concurrent.futures.ThreadPoolExecutor") as mock_executor,
         patch("clockman.utils.notifier.notify") as mock_notify,
+        patch("clockman.utils.notifier.get_config_manager") as mock_config,
     ):
+        mock_config_instance = MagicMock()
+        mock_config_instance.are_notifications_enabled.return_value = True
+        mock_config.return_value = mock_config_instance
+
         # Mock running loop exists
         mock_get_loop.return_value = MagicMock()
 
@@ -155,7 +230,9 @@ def test_notify_sync_in_async_context() -> None:
         result = notifier.notify_sync("Async Context", "Message")
 
         assert result is None
-        mock_executor_instance.submit.assert_called_once()
+        mock_executor_instance.submit.assert_called_once_with(
+            notifier._notify_in_new_loop, "Async Context", "Message"
+        )
 
 
 def test_notify_task_start() -> None:
@@ -187,6 +187,27 @@ class TestSessionRepository:
         assert retrieved.id == later_session.id
         assert retrieved.task_name == "Later Active"
 
+    def test_update_session_normalizes_assigned_tags(
+        self, session_repository: SessionRepository
+    ) -> None:
+        """Test that tags assigned without validation are normalized on write."""
+        # Arrange
+        session = TimeSession(
+            task_name="Task", description=None, tags=["original"], end_time=None
+        )
+        session_repository.create_session(session)
+
+        # Attribute assignment bypasses the tags validator
+        session.tags = ["Work", "work", " "]
+
+        # Act
+        session_repository.update_session(session)
+
+        # Assert
+        retrieved = session_repository.get_session_by_id(session.id)
+        assert retrieved is not None
+        assert retrieved.tags == ["work"]
+
     def test_update_session(self, session_repository: SessionRepository) -> None:
         """Test updating an existing session."""
         # Arrange
@@ -689,6 +710,36 @@ class TestSessionRepository:
         assert stats.first_session is None
         assert stats.last_session is None
 
+    def test_row_to_session_normalizes_stored_raw_tags(
+        self, session_repository: SessionRepository
+    ) -> None:
+        """Test that unnormalized tags already stored in a row are normalized on read."""
+        # Arrange - a row written before tags were normalized on write
+        session_id = uuid4()
+        with session_repository.db_manager.get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO sessions (id, task_name, tags, start_time, is_active, metadata)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    str(session_id),
+                    "Task",
+                    json.dumps(["Work", "work", " "]),
+                    datetime(2024, 1, 1, 9, 0, 0, tzinfo=timezone.utc).isoformat(),
+                    False,
+                    "{}",
+                ),
+            )
+            conn.commit()
+
+        # Act
+        retrieved = session_repository.get_session_by_id(session_id)
+
+        # Assert
+        assert retrieved is not None
+        assert retrieved.tags == ["work"]
+
     def test_row_to_session_conversion(
         self, session_repository: SessionRepository
     ) -> None:
@@ -489,6 +489,20 @@ class TestTimeTracker:
         assert updated_session.task_name == "Updated Task"
         assert updated_session.description == "Updated description"
 
+    def test_update_session_normalizes_tags(self, time_tracker: TimeTracker) -> None:
+        """Test that updated tags are normalized on the update-then-read round trip."""
+        # Arrange
+        session_id = time_tracker.start_session("Task")
+        time_tracker.stop_session(session_id)
+
+        # Act
+        time_tracker.update_session(session_id, tags=["Work", "work", " "])
+        retrieved = time_tracker.get_session_by_id(session_id)
+
+        # Assert
+        assert retrieved is not None
+        assert retrieved.tags == ["work"]
+
     def test_update_session_clear_description(self, time_tracker: TimeTracker) -> None:
         """Test clearing description with empty string."""
         # Arrange
@@ -30,9 +30,8 @@ def format_duration(duration: timedelta, show_seconds: Optional[bool] = None) ->
     if total_seconds < 0:
         return "0s"
 
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
 
     parts = []
 
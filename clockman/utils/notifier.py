@@ -8,26 +8,38 @@ logging integration, and configuration support.
 import asyncio
 import logging
 import os
-from typing import Optional
-
-from desktop_notifier import DesktopNotifier
+from typing import TYPE_CHECKING, Optional
 
 from .config import get_config_manager
 
+if TYPE_CHECKING:
+    from desktop_notifier import DesktopNotifier
+
 logger = logging.getLogger(__name__)
 
 # Global notifier instance
-_notifier: Optional[DesktopNotifier] = None
+_notifier: Optional["DesktopNotifier"] = None
 
 
-def _get_notifier() -> DesktopNotifier:
+def _get_notifier() -> "DesktopNotifier":
     """Get or create the global DesktopNotifier instance."""
     global _notifier
     if _notifier is None:
+        # Imported on first use so commands that never notify skip its cost
+        from desktop_notifier import DesktopNotifier
+
         _notifier = DesktopNotifier(app_name="Clockman")
     return _notifier
 
 
+def _log_fallback(title: str, message: str, reason: Optional[str] = None) -> None:
+    """Log a notification in place of showing it, skipping work if INFO is off."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    suffix = f" ({reason})" if reason else ""
+    logger.info(f"[NOTIFICATION] {title}: {message}{suffix}")
+
+
 async def notify(title: str, message: str) -> Optional[str]:
     """
     Send a desktop notification asynchronously.
@@ -49,7 +61,7 @@ async def notify(title: str, message: str) -> Optional[str]:
     # Check if notifications are disabled
     if not config.are_notifications_enabled():
         if config.should_fallback_to_log():
-            logger.info(f"[NOTIFICATION] {title}: {message}")
+            _log_fallback(title, message)
         return None
 
     # Check for headless environment or CI
@@ -61,31 +73,41 @@ async def notify(title: str, message: str) -> Optional[str]:
 
     if is_headless:
         if config.should_fallback_to_log():
-            logger.info(f"[NOTIFICATION] {title}: {message} (headless/CI environment)")
+            _log_fallback(title, message, "headless/CI environment")
         return "Headless or CI environment"
 
     try:
         notifier = _get_notifier()
         timeout_ms = config.get_notification_timeout()
         await notifier.send(title=title, message=message, timeout=timeout_ms)
-        logger.debug(f"Notification sent: {title}")
+        logger.debug("Notification sent: %s", title)
         return None
 
     except ImportError as e:
         error_msg = f"Desktop notifications not available: {e}"
         logger.warning(error_msg)
         if config.should_fallback_to_log():
-            logger.info(f"[NOTIFICATION] {title}: {message} (fallback)")
+            _log_fallback(title, message, "fallback")
         return error_msg
 
     except Exception as e:
         error_msg = f"Failed to send notification: {e}"
         logger.error(error_msg)
         if config.should_fallback_to_log():
-            logger.info(f"[NOTIFICATION] {title}: {message} (fallback)")
+            _log_fallback(title, message, "fallback")
         return error_msg
 
 
+def _notify_in_new_loop(title: str, message: str) -> Optional[str]:
+    """Run notify() on a fresh event loop owned by the calling thread."""
+    new_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(new_loop)
+    try:
+        return new_loop.run_until_complete(notify(title, message))
+    finally:
+        new_loop.close()
+
+
 def notify_sync(title: str, message: str) -> Optional[str]:
     """
     Send a desktop notification synchronously.
@@ -105,23 +127,22 @@ def notify_sync(title: str, message: str) -> Optional[str]:
         >>> if error:
         ...     print(f"Could not send notification: {error}")
     """
+    # Skip event loop setup entirely when there is nothing to deliver
+    config = get_config_manager()
+    if not config.are_notifications_enabled():
+        if config.should_fallback_to_log():
+            _log_fallback(title, message)
+        return None
+
     try:
         # Try to use existing event loop
         asyncio.get_running_loop()
         # If we're in an async context, we need to use a thread
         import concurrent.futures
 
-        def run_in_thread() -> Optional[str]:
-            # Create new event loop in thread
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
-            try:
-                return new_loop.run_until_complete(notify(title, message))
-            finally:
-                new_loop.close()
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(run_in_thread)
+        # A single task is submitted, so one worker is all the pool needs
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(_notify_in_new_loop, title, message)
             result = future.result(timeout=10)  # 10 second timeout
             return result
 
@@ -131,15 +152,13 @@ def notify_sync(title: str, message: str) -> Optional[str]:
             return asyncio.run(notify(title, message))
         except Exception as e:
             logger.error(f"Failed to run notification: {e}")
-            config = get_config_manager()
             if config.should_fallback_to_log():
-                logger.info(f"[NOTIFICATION] {title}: {message} (fallback)")
+                _log_fallback(title, message, "fallback")
             return str(e)
     except Exception as e:
         logger.error(f"Unexpected error in notify_sync: {e}")
-        config = get_config_manager()
         if config.should_fallback_to_log():
-            logger.info(f"[NOTIFICATION] {title}: {message} (fallback)")
+            _log_fallback(title, message, "fallback")
         return str(e)
 
 